@@ -1,10 +1,102 @@
 import streamlit as st
 import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+from pydantic import BaseModel, ValidationError
 import json
-from datetime import datetime, timedelta
+import re
 import time
 import os
 
+# Matches an optional ```json fenced block anywhere in the model output
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.S)
+
+# Static prompt skeleton, interpolated once per generation
+_PROMPT_TEMPLATE = """You are an expert travel planner. Create a detailed {num_days}-day travel itinerary for {destination}.
+
+Trip Details:
+- Travelers: {num_people} {group_type}
+- Budget: {budget}
+- Interests: {interests}
+- Pace: {pace}
+- Accommodation: {accommodation}
+
+Provide a comprehensive itinerary in JSON format with this EXACT structure:
+{{
+    "overview": "Brief 3-sentence overview of the destination and what makes it special",
+    "daily_itineraries": [
+        {{
+            "day": 1,
+            "title": "Descriptive day title",
+            "activities": [
+                {{
+                    "time": "9:00 AM",
+                    "activity": "Activity name",
+                    "description": "Detailed description",
+                    "duration": "2 hours",
+                    "cost": 50
+                }}
+            ],
+            "meals": [
+                {{
+                    "meal": "breakfast",
+                    "restaurant": "Restaurant name",
+                    "cuisine": "Cuisine type",
+                    "cost": 20
+                }}
+            ],
+            "estimated_cost": 200,
+            "travel_tips": "Specific tips for this day"
+        }}
+    ],
+    "famous_attractions": ["attraction1", "attraction2", "..."],
+    "local_cuisine": ["dish1", "dish2", "..."],
+    "travel_tips": ["tip1", "tip2", "..."],
+    "packing_suggestions": ["item1", "item2", "..."],
+    "total_estimated_cost": 1500
+}}
+
+Important:
+- Include 3-4 activities per day for {pace} pace
+- All costs in USD
+- Make it realistic and specific to {destination}
+- Consider {budget} budget level
+- Return ONLY valid JSON, no markdown formatting"""
+
+# ============================================
+# RESPONSE SCHEMA
+# ============================================
+# Passed to Gemini as response_schema for grammar-constrained decoding,
+# so the reply is guaranteed to match the structure the UI expects
+class Activity(BaseModel):
+    time: str
+    activity: str
+    description: str
+    duration: str
+    cost: float
+
+class Meal(BaseModel):
+    meal: str
+    restaurant: str
+    cuisine: str
+    cost: float
+
+class Day(BaseModel):
+    day: int
+    title: str
+    activities: list[Activity]
+    meals: list[Meal]
+    estimated_cost: float
+    travel_tips: str
+
+class Itinerary(BaseModel):
+    overview: str
+    daily_itineraries: list[Day]
+    famous_attractions: list[str]
+    local_cuisine: list[str]
+    travel_tips: list[str]
+    packing_suggestions: list[str]
+    total_estimated_cost: float
+
 # ============================================
 # PAGE CONFIGURATION
 # ============================================
@@ -17,7 +109,7 @@ st.set_page_config(
 # ============================================
 # CUSTOM STYLING
 # ============================================
-st.markdown("""
+_CSS_BLOCK = """
     <style>
     .main-header {
         font-size: 3rem;
@@ -62,103 +154,298 @@ st.markdown("""
         border-left: 5px solid #1E88E5;
     }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def _inject_css():
+    """Send the style block once per server process; replayed on later reruns"""
+    st.markdown(_CSS_BLOCK, unsafe_allow_html=True)
+    return True
+
+_inject_css()
 
 # ============================================
 # GOOGLE GEMINI AI SETUP
 # ============================================
 def setup_gemini_api():
-    """Configure Google Gemini AI"""
+    """Configure Google Gemini AI (memoized per API key)"""
     api_key = os.getenv("GOOGLE_API_KEY") or st.session_state.get("api_key", "")
-    
-    if api_key:
+
+    if not api_key:
+        return False
+
+    # Skip the redundant genai.configure() when this key is already active
+    if st.session_state.get("_configured_key") == api_key:
+        return True
+
+    try:
+        genai.configure(api_key=api_key)
+        st.session_state["_configured_key"] = api_key
+        return True
+    except Exception as e:
+        st.error(f"❌ API Configuration Error: {e}")
+        return False
+
+# Sidebar label -> Gemini model name
+_MODEL_OPTIONS = {
+    "Flash (fast)": "gemini-1.5-flash",
+    "Pro (quality)": "gemini-1.5-pro",
+}
+
+@st.cache_resource
+def get_gemini_model(model_name='gemini-1.5-flash'):
+    """Return a shared GenerativeModel handle (built once per model name)"""
+    return genai.GenerativeModel(model_name)
+
+# ============================================
+# SEMANTIC CACHE
+# ============================================
+# Near-duplicate trip requests (reordered interests, small wording
+# differences) resolve to a prior itinerary instead of a new LLM call
+_SEM_CACHE_MAX = 64
+_SEM_SIM_THRESHOLD = 0.95
+
+@st.cache_resource
+def _get_embedder():
+    """Load the sentence encoder once per process (import deferred: it's heavy)"""
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer("all-MiniLM-L6-v2")
+
+def _semantic_cache_get(key, params):
+    """Embed the fuzzy trip key and look for a similar prior request.
+
+    Only free-text fields (destination, interests) go through the
+    embedding: single-token differences like 5 vs 6 days still embed at
+    ~0.97 similarity, so the discrete `params` tuple (days, people,
+    budget, model, ...) must match exactly before an entry is returned.
+    Returns (embedding, itinerary-or-None); the embedding is reused for
+    insertion so each request is only encoded once.
+    """
+    embedding = _get_embedder().encode(key, normalize_embeddings=True)
+    for cached_emb, cached_params, cached_itinerary in st.session_state.get("_sem_cache", []):
+        if cached_params == params and float(embedding @ cached_emb) >= _SEM_SIM_THRESHOLD:
+            return embedding, cached_itinerary
+    return embedding, None
+
+def _semantic_cache_put(embedding, params, itinerary):
+    cache = st.session_state.setdefault("_sem_cache", [])
+    cache.append((embedding, params, itinerary))
+    del cache[:-_SEM_CACHE_MAX]
+
+@st.cache_data(ttl=86400, persist="disk", max_entries=500, show_spinner=False)
+def _generate_itinerary_cached(destination, num_days, num_people, budget,
+                               interests, group_type, pace, accommodation,
+                               model_name='gemini-1.5-flash', _on_chunk=None):
+    """Call Gemini (streaming) and parse the itinerary JSON.
+
+    Cached to disk for a day so identical trip requests skip the API
+    call and survive app restarts.
+    Raises on API or parse failure so bad results are never cached.
+    `_on_chunk` (excluded from the cache key) receives each streamed
+    chunk's text for progressive display, and None at the start of each
+    attempt so the caller can reset its preview before a retry.
+    """
+
+    prompt = _PROMPT_TEMPLATE.format(
+        destination=destination, num_days=num_days, num_people=num_people,
+        budget=budget, interests=", ".join(interests),
+        group_type=group_type, pace=pace, accommodation=accommodation
+    )
+
+    model = get_gemini_model(model_name)
+
+    # Retry transient failures (rate limits, 5xx, malformed JSON) with
+    # exponential backoff before surfacing an error to the user
+    last_error = None
+    for attempt in range(3):
         try:
-            genai.configure(api_key=api_key)
-            return True
-        except Exception as e:
-            st.error(f"❌ API Configuration Error: {e}")
-            return False
-    return False
-
-def generate_itinerary_with_gemini(destination, num_days, num_people, budget, 
-                                   interests, group_type, pace, accommodation):
+            if _on_chunk is not None:
+                _on_chunk(None)
+
+            stream = model.generate_content(
+                prompt,
+                generation_config={
+                    "response_mime_type": "application/json",
+                    "response_schema": Itinerary,
+                    "temperature": 0.7,
+                },
+                stream=True
+            )
+
+            # Accumulate chunk texts in a list and join once at the end
+            parts = []
+            for chunk in stream:
+                parts.append(chunk.text)
+                if _on_chunk is not None:
+                    _on_chunk(chunk.text)
+
+            # JSON mode means the payload is normally bare JSON; keep the
+            # fence extraction as a fallback for models that fence anyway
+            text = "".join(parts).strip()
+            m = _FENCE_RE.search(text)
+            if m:
+                text = m.group(1).strip()
+
+            # Don't attempt a parse on a truncated stream: a complete JSON
+            # document always ends with a closing brace or bracket
+            if not text.endswith(("}", "]")):
+                raise json.JSONDecodeError("Streamed response appears truncated", text, len(text))
+
+            itinerary = Itinerary.model_validate_json(text).model_dump()
+            itinerary["destination"] = destination
+
+            return itinerary
+
+        except (json.JSONDecodeError, ValidationError,
+                google_exceptions.ResourceExhausted,
+                google_exceptions.ServerError) as e:
+            if isinstance(e, json.JSONDecodeError):
+                st.session_state["_last_bad_response"] = e.doc
+            elif isinstance(e, ValidationError):
+                st.session_state["_last_bad_response"] = text
+            last_error = e
+            if attempt < 2:
+                time.sleep(2 ** attempt)
+
+    raise last_error
+
+def generate_itinerary_with_gemini(destination, num_days, num_people, budget,
+                                   interests, group_type, pace, accommodation,
+                                   model_name='gemini-1.5-flash'):
     """Generate itinerary using Google Gemini AI"""
-    
-    prompt = f"""You are an expert travel planner. Create a detailed {num_days}-day travel itinerary for {destination}.
 
-Trip Details:
-- Travelers: {num_people} {group_type}
-- Budget: {budget}
-- Interests: {', '.join(interests)}
-- Pace: {pace}
-- Accommodation: {accommodation}
+    sem_key = f"{destination}|{','.join(sorted(interests))}"
+    sem_params = (num_days, num_people, budget, group_type, pace,
+                  accommodation, model_name)
+    embedding, cached = _semantic_cache_get(sem_key, sem_params)
+    if cached is not None:
+        st.write("⚡ Found a matching itinerary from a recent request!")
+        return cached
 
-Provide a comprehensive itinerary in JSON format with this EXACT structure:
-{{
-    "overview": "Brief 3-sentence overview of the destination and what makes it special",
-    "daily_itineraries": [
-        {{
-            "day": 1,
-            "title": "Descriptive day title",
-            "activities": [
-                {{
-                    "time": "9:00 AM",
-                    "activity": "Activity name",
-                    "description": "Detailed description",
-                    "duration": "2 hours",
-                    "cost": 50
-                }}
-            ],
-            "meals": [
-                {{
-                    "meal": "breakfast",
-                    "restaurant": "Restaurant name",
-                    "cuisine": "Cuisine type",
-                    "cost": 20
-                }}
-            ],
-            "estimated_cost": 200,
-            "travel_tips": "Specific tips for this day"
-        }}
-    ],
-    "famous_attractions": ["attraction1", "attraction2", "..."],
-    "local_cuisine": ["dish1", "dish2", "..."],
-    "travel_tips": ["tip1", "tip2", "..."],
-    "packing_suggestions": ["item1", "item2", "..."],
-    "total_estimated_cost": 1500
-}}
+    st.write("✨ Generating personalized recommendations...")
 
-Important:
-- Include 3-4 activities per day for {pace} pace
-- All costs in USD
-- Make it realistic and specific to {destination}
-- Consider {budget} budget level
-- Return ONLY valid JSON, no markdown formatting"""
+    # Stream the response so the first tokens appear within ~1s instead
+    # of blocking until the full itinerary is generated
+    preview = st.empty()
+    received = []
+
+    def _show_chunk(chunk_text):
+        if chunk_text is None:  # new attempt: discard the failed stream
+            received.clear()
+            preview.empty()
+            return
+        received.append(chunk_text)
+        preview.code("".join(received), language="json")
 
     try:
-        model = genai.GenerativeModel('gemini-pro')
-        response = model.generate_content(prompt)
-        
-        # Clean response
-        text = response.text.strip()
-        if "```json" in text:
-            text = text.split("```json")[1].split("```")[0].strip()
-        elif "```" in text:
-            text = text.split("```")[1].split("```")[0].strip()
-        
-        itinerary = json.loads(text)
-        itinerary["destination"] = destination
-        
+        itinerary = _generate_itinerary_cached(
+            destination, num_days, num_people, budget,
+            tuple(sorted(interests)), group_type, pace, accommodation,
+            model_name, _on_chunk=_show_chunk
+        )
+        preview.empty()
+        _semantic_cache_put(embedding, sem_params, itinerary)
         return itinerary
-        
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, ValidationError):
         st.error(f"❌ Failed to parse AI response. Please try again.")
-        st.expander("Debug Info").write(f"Error: {e}\nResponse: {text[:500]}")
         return None
     except Exception as e:
         st.error(f"❌ AI Error: {str(e)}")
         return None
 
+# ============================================
+# ITINERARY RENDERING
+# ============================================
+@st.fragment
+def _render_day(day_data):
+    """Render one day's card; each day is its own fragment so reruns
+    triggered elsewhere on the page don't redraw the whole history"""
+
+    # Build one HTML payload per day: a single st.markdown costs one
+    # server→browser message instead of one per activity. Lines are kept
+    # at column 0: markdown treats 4+ leading spaces as a code block
+    html_parts = [
+        f'<div class="day-card">'
+        f"<h3>Day {day_data['day']}: {day_data['title']}</h3>"
+        f"<b>Daily Budget:</b> ${day_data['estimated_cost']:.0f}"
+        f'</div>'
+        f'<h4>🎯 Activities</h4>'
+    ]
+    for act in day_data["activities"]:
+        html_parts.append(
+            f'<div class="activity-item">'
+            f"<h4>⏰ {act['time']} - {act['activity']}</h4>"
+            f"<p>{act['description']}</p>"
+            f"<p><small>⏱️ {act['duration']} | 💰 ${act['cost']:.0f}</small></p>"
+            f'</div>'
+        )
+
+    # Dining goes into the same payload as a flex row: st.columns
+    # would emit one container message per meal
+    html_parts.append('<h4>🍽️ Dining</h4>')
+    html_parts.append(
+        '<div style="display:flex;gap:16px">' + "".join(
+            f'<div style="flex:1"><b>{meal["meal"].title()}</b><br>'
+            f'🍴 {meal["restaurant"]}<br>'
+            f'🌍 {meal["cuisine"]}<br>'
+            f'💰 ${meal["cost"]:.0f}</div>'
+            for meal in day_data["meals"]
+        ) + '</div>'
+    )
+    st.markdown("\n".join(html_parts), unsafe_allow_html=True)
+
+    st.info(f"💡 {day_data['travel_tips']}")
+    st.markdown("")
+
+# ============================================
+# EXPORT HELPERS
+# ============================================
+@st.cache_data(max_entries=8, show_spinner=False)
+def _build_json_export(data):
+    """Serialize the itinerary once as compact UTF-8 JSON (~3-4x smaller than indented)"""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _build_txt_export(data):
+    """Render the itinerary as plain text (cached per itinerary)"""
+    text = f"AI-GENERATED ITINERARY: {data['destination']}\n{'='*60}\n\n"
+    text += f"OVERVIEW:\n{data['overview']}\n\n"
+    text += f"TOTAL COST: ${data['total_estimated_cost']:.0f}\n\n"
+    for day in data['daily_itineraries']:
+        text += f"\nDAY {day['day']}: {day['title']}\n"
+        text += f"Budget: ${day['estimated_cost']:.0f}\n\n"
+        for act in day['activities']:
+            text += f"  {act['time']} - {act['activity']}\n"
+            text += f"    {act['description']}\n"
+        text += "\n"
+    return text
+
+@st.fragment
+def _render_exports(data, destination):
+    """Export buttons, isolated so their reruns don't redraw the whole page"""
+    st.markdown("### 💾 Export Your Itinerary")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.download_button(
+            "📥 Download JSON",
+            _build_json_export(data),
+            f"ai_itinerary_{destination.replace(' ', '_')}.json",
+            "application/json"
+        )
+
+    with col2:
+        st.download_button(
+            "📄 Download TXT",
+            _build_txt_export(data),
+            f"ai_itinerary_{destination.replace(' ', '_')}.txt"
+        )
+
+    with col3:
+        if st.button("🔄 Generate New"):
+            del st.session_state.itinerary
+            st.rerun(scope="app")
+
 # ============================================
 # HEADER
 # ============================================
@@ -169,7 +456,10 @@ st.markdown('<p style="text-align: center; color: #666;">Intelligent travel plan
 # ============================================
 # API KEY SETUP (Sidebar)
 # ============================================
-with st.sidebar.expander("🔑 API Key Setup", expanded=not setup_gemini_api()):
+# Check if API is configured (once per rerun)
+api_configured = setup_gemini_api()
+
+with st.sidebar.expander("🔑 API Key Setup", expanded=not api_configured):
     st.markdown("""
     **Get FREE Google Gemini API Key:**
     1. Go to [makersuite.google.com/app/apikey](https://makersuite.google.com/app/apikey)
@@ -190,60 +480,73 @@ with st.sidebar.expander("🔑 API Key Setup", expanded=not setup_gemini_api()):
     if st.button("Save API Key"):
         st.session_state.api_key = api_key_input
         os.environ["GOOGLE_API_KEY"] = api_key_input
+        get_gemini_model.clear()  # drop handles bound to the old key
         if setup_gemini_api():
             st.success("✅ API Key configured successfully!")
             st.rerun()
 
-# Check if API is configured
-api_configured = setup_gemini_api()
-
 # ============================================
 # SIDEBAR INPUTS
 # ============================================
 st.sidebar.header("🎒 Plan Your Trip")
 
-destination = st.sidebar.text_input(
-    "🌍 Destination",
-    placeholder="e.g., Paris, Tokyo, Bali",
-    help="Enter any city or country"
-)
+# A form commits all widget values in one rerun on submit, instead of
+# rerunning the whole script on every individual widget change
+with st.sidebar.form("trip_form", clear_on_submit=False):
+    destination = st.text_input(
+        "🌍 Destination",
+        placeholder="e.g., Paris, Tokyo, Bali",
+        help="Enter any city or country"
+    )
 
-col1, col2 = st.sidebar.columns(2)
-num_days = col1.number_input("📅 Days", 1, 30, 5)
-num_people = col2.number_input("👥 People", 1, 20, 2)
+    col1, col2 = st.columns(2)
+    num_days = col1.number_input("📅 Days", 1, 30, 5)
+    num_people = col2.number_input("👥 People", 1, 20, 2)
 
-budget = st.sidebar.select_slider(
-    "💰 Budget",
-    options=["Low", "Medium", "High"],
-    value="Medium"
-)
+    budget = st.select_slider(
+        "💰 Budget",
+        options=["Low", "Medium", "High"],
+        value="Medium"
+    )
+
+    st.markdown("---")
+    st.subheader("🎯 Preferences")
 
-st.sidebar.markdown("---")
-st.sidebar.subheader("🎯 Preferences")
+    interests = st.multiselect(
+        "Interests",
+        ["Culture", "Food", "Adventure", "Nature", "Shopping", "History", "Nightlife", "Relaxation"],
+        default=["Culture", "Food"]
+    )
 
-interests = st.sidebar.multiselect(
-    "Interests",
-    ["Culture", "Food", "Adventure", "Nature", "Shopping", "History", "Nightlife", "Relaxation"],
-    default=["Culture", "Food"]
-)
+    group_type = st.selectbox(
+        "👨‍👩‍👧‍👦 Group Type",
+        ["Solo", "Couple", "Family", "Friends"]
+    )
 
-group_type = st.sidebar.selectbox(
-    "👨‍👩‍👧‍👦 Group Type",
-    ["Solo", "Couple", "Family", "Friends"]
-)
+    pace = st.selectbox(
+        "⏱️ Travel Pace",
+        ["Relaxed", "Moderate", "Packed"]
+    )
 
-pace = st.sidebar.selectbox(
-    "⏱️ Travel Pace",
-    ["Relaxed", "Moderate", "Packed"]
-)
+    accommodation = st.selectbox(
+        "🏨 Accommodation",
+        ["Budget", "Mid-range", "Luxury"]
+    )
 
-accommodation = st.sidebar.selectbox(
-    "🏨 Accommodation",
-    ["Budget", "Mid-range", "Luxury"]
-)
+    model_choice = st.radio(
+        "🧠 Model",
+        list(_MODEL_OPTIONS),
+        horizontal=True,
+        help="Flash responds 3-5x faster; Pro gives more detailed plans"
+    )
 
-st.sidebar.markdown("---")
-generate_btn = st.sidebar.button("🚀 Generate AI Itinerary", type="primary", disabled=not api_configured)
+    st.markdown("---")
+    generate_btn = st.form_submit_button("🚀 Generate AI Itinerary", type="primary", disabled=not api_configured)
+
+if st.sidebar.button("🗑️ Clear itinerary cache"):
+    _generate_itinerary_cached.clear()
+    st.session_state.pop("_sem_cache", None)
+    st.sidebar.success("✅ Cache cleared")
 
 if not api_configured:
     st.sidebar.warning("⚠️ Please configure API key above")
@@ -257,21 +560,12 @@ if generate_btn:
     elif not interests:
         st.error("⚠️ Please select at least one interest!")
     else:
-        # AI Generation Animation
+        # AI Generation Progress
         with st.status("🤖 AI is analyzing your preferences...", expanded=True) as status:
-            st.write("🔍 Understanding your travel style...")
-            time.sleep(1)
-            st.write("🌍 Researching destination information...")
-            time.sleep(1)
-            st.write("🧠 AI is processing thousands of possibilities...")
-            time.sleep(1)
-            st.write("📊 Optimizing itinerary based on your budget...")
-            time.sleep(1)
-            st.write("✨ Generating personalized recommendations...")
-            
             itinerary = generate_itinerary_with_gemini(
                 destination, num_days, num_people, budget,
-                interests, group_type, pace, accommodation
+                interests, group_type, pace, accommodation,
+                _MODEL_OPTIONS[model_choice]
             )
             
             if itinerary:
@@ -289,18 +583,22 @@ if 'itinerary' in st.session_state:
     st.markdown(f'## 📍 {data["destination"]}')
     st.markdown(f'<div class="info-box">{data["overview"]}</div>', unsafe_allow_html=True)
     
-    # Metrics
-    col1, col2, col3, col4 = st.columns(4)
+    # Metrics as one flex row (st.columns + st.metric is 8 messages)
     total = data["total_estimated_cost"]
-    
-    with col1:
-        st.metric("💵 Total Cost", f"${total:,.0f}")
-    with col2:
-        st.metric("👤 Per Person", f"${total/num_people:,.0f}")
-    with col3:
-        st.metric("📅 Duration", f"{num_days} days")
-    with col4:
-        st.metric("🎯 Activities", len(data.get("famous_attractions", [])))
+    metrics = [
+        ("💵 Total Cost", f"${total:,.0f}"),
+        ("👤 Per Person", f"${total/num_people:,.0f}"),
+        ("📅 Duration", f"{num_days} days"),
+        ("🎯 Activities", len(data.get("famous_attractions", []))),
+    ]
+    st.markdown(
+        '<div style="display:flex;gap:16px;text-align:center">' + "".join(
+            f'<div style="flex:1"><div style="color:#666;font-size:0.9rem">{label}</div>'
+            f'<div style="font-size:1.8rem;font-weight:600">{value}</div></div>'
+            for label, value in metrics
+        ) + '</div>',
+        unsafe_allow_html=True
+    )
     
     st.markdown("---")
     
@@ -308,33 +606,7 @@ if 'itinerary' in st.session_state:
     st.markdown("## 📅 Your AI-Generated Itinerary")
     
     for day_data in data["daily_itineraries"]:
-        st.markdown(f'<div class="day-card">', unsafe_allow_html=True)
-        st.markdown(f"### Day {day_data['day']}: {day_data['title']}")
-        st.markdown(f"**Daily Budget:** ${day_data['estimated_cost']:.0f}")
-        st.markdown('</div>', unsafe_allow_html=True)
-        
-        st.markdown("#### 🎯 Activities")
-        for act in day_data["activities"]:
-            st.markdown(f"""
-            <div class="activity-item">
-                <h4>⏰ {act['time']} - {act['activity']}</h4>
-                <p>{act['description']}</p>
-                <p><small>⏱️ {act['duration']} | 💰 ${act['cost']}</small></p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        st.markdown("#### 🍽️ Dining")
-        meal_cols = st.columns(len(day_data["meals"]))
-        for idx, meal in enumerate(day_data["meals"]):
-            meal_cols[idx].markdown(f"""
-            **{meal['meal'].title()}**  
-            🍴 {meal['restaurant']}  
-            🌍 {meal['cuisine']}  
-            💰 ${meal['cost']}
-            """)
-        
-        st.info(f"💡 {day_data['travel_tips']}")
-        st.markdown("")
+        _render_day(day_data)
     
     st.markdown("---")
     
@@ -362,39 +634,7 @@ if 'itinerary' in st.session_state:
     st.markdown("---")
     
     # Download
-    st.markdown("### 💾 Export Your Itinerary")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.download_button(
-            "📥 Download JSON",
-            json.dumps(data, indent=2),
-            f"ai_itinerary_{destination.replace(' ', '_')}.json",
-            "application/json"
-        )
-    
-    with col2:
-        text = f"AI-GENERATED ITINERARY: {data['destination']}\n{'='*60}\n\n"
-        text += f"OVERVIEW:\n{data['overview']}\n\n"
-        text += f"TOTAL COST: ${data['total_estimated_cost']}\n\n"
-        for day in data['daily_itineraries']:
-            text += f"\nDAY {day['day']}: {day['title']}\n"
-            text += f"Budget: ${day['estimated_cost']}\n\n"
-            for act in day['activities']:
-                text += f"  {act['time']} - {act['activity']}\n"
-                text += f"    {act['description']}\n"
-            text += "\n"
-        
-        st.download_button(
-            "📄 Download TXT",
-            text,
-            f"ai_itinerary_{destination.replace(' ', '_')}.txt"
-        )
-    
-    with col3:
-        if st.button("🔄 Generate New"):
-            del st.session_state.itinerary
-            st.rerun()
+    _render_exports(data, destination)
 
 else:
     # Welcome Screen
@@ -426,4 +666,4 @@ st.markdown("""
     <p>Powered by Google Gemini AI | Natural Language Processing | Machine Learning</p>
     <p><small>Using generative AI for intelligent travel recommendations</small></p>
 </div>
-""", unsafe_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
\ No newline at end of file